@@ -1,5 +1,5 @@
 import logging, time
-from python_basic_template.data_handler.load_data import load_raw_data
+from python_basic_template.data_handler.load_data import load_raw_head
 
 
 logger = logging.getLogger(__name__)
@@ -7,14 +7,14 @@ logger = logging.getLogger(__name__)
 
 
 def main():
-    start = time.time()
+    start = time.perf_counter_ns()
     logger.info("Starting data preparation...")
-    df = load_raw_data('example.csv')
+    df = load_raw_head('example.csv', 5)
     print(df.head())
     
 
-    end = time.time()
-    logger.info(f"Data preparation completed in {end - start:.2f} seconds.")
+    elapsed_s = (time.perf_counter_ns() - start) / 1e9
+    logger.info("Data preparation completed in %.2f seconds.", elapsed_s)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,191 @@
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
 import pandas as pd
 
 from python_basic_template.settings.settings import DataDirs
 
 
-def load_raw_data(file_name: str) -> pd.DataFrame:
-    file_path = DataDirs.RAW / file_name
-    df = pd.read_csv(file_path)
-    return df
\ No newline at end of file
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    import pyarrow.feather as pf
+    _PYARROW_AVAILABLE = True
+except Exception:
+    _PYARROW_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+def load_raw_data(
+    file_name: str,
+    columns: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    nrows: Optional[int] = None,
+) -> pd.DataFrame:
+    """Load a raw CSV with pyarrow-backed dtypes, optionally projecting `columns`, forcing `dtype` and reading only the first `nrows` rows."""
+    if nrows is not None and nrows < 0:
+        raise ValueError(f"nrows must be >= 0, got {nrows}")
+    file_path = DataDirs.RAW() / file_name
+    if not _PYARROW_AVAILABLE:
+        return pd.read_csv(file_path, usecols=columns, dtype=dtype, nrows=nrows)
+
+    try:
+        cache: Optional[Path] = _cache_path(file_name)
+    except OSError:
+        cache = None
+    # full reads are cached as LZ4 Feather and reused while the cache is not older than the CSV;
+    # nrows reads infer types from their own leading blocks, so they never touch the cache
+    if (
+        cache is not None
+        and dtype is None
+        and nrows is None
+        and cache.exists()
+        and cache.stat().st_mtime >= file_path.stat().st_mtime
+    ):
+        return _read_cache(cache, columns).to_pandas(types_mapper=pd.ArrowDtype)
+
+    read_options = pv.ReadOptions(use_threads=True, block_size=1 << 20)
+    parse_options = pv.ParseOptions(delimiter=",")
+    convert_options = pv.ConvertOptions(include_columns=columns, column_types=dtype)
+
+    if nrows is None:
+        table = pv.read_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+        if cache is not None and columns is None and dtype is None:
+            _write_cache(table, cache)
+    else:
+        # types come from the leading blocks only and may be narrower than a full read (int64 vs double)
+        table = _read_first_rows(file_path, nrows, read_options, parse_options, convert_options)
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+
+def _cache_path(file_name: str) -> Path:
+    # the whole relative path, so 2023/sales.csv and 2024/sales.csv get separate caches
+    key = Path(file_name).as_posix().replace("/", "__")
+    return DataDirs.INTERIM() / f"{key}.feather"
+
+
+def _read_cache(cache: Path, columns: Optional[List[str]]) -> "pa.Table":
+    if columns is not None:
+        # fail the same way the CSV reader does for an unknown column
+        with pa.memory_map(str(cache)) as source:
+            names = set(pa.ipc.open_file(source).schema.names)
+        for name in columns:
+            if name not in names:
+                raise pa.ArrowKeyError(f"Column '{name}' in include_columns does not exist in CSV file")
+        # read_table keeps file order; the CSV reader returns include_columns order
+        return pf.read_table(cache, columns=columns, memory_map=True).select(columns)
+    return pf.read_table(cache, memory_map=True)
+
+
+def _write_cache(table: "pa.Table", cache: Path) -> None:
+    """Write the Feather cache atomically; a failure is logged and otherwise ignored."""
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=".feather_", dir=cache.parent)
+        os.close(fd)
+        pf.write_feather(table, tmp_path, compression="lz4")
+        os.replace(tmp_path, cache)
+    except (OSError, pa.ArrowException) as e:
+        logger.warning("Could not write cache %s: %s", cache, e)
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _read_first_rows(
+    file_path: Path,
+    n: int,
+    read_options: "pv.ReadOptions",
+    parse_options: "pv.ParseOptions",
+    convert_options: "pv.ConvertOptions",
+) -> "pa.Table":
+    """Read the first `n` rows of a CSV, stopping as soon as enough blocks have been parsed."""
+    try:
+        reader = pv.open_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+        batches, total = [], 0
+        for batch in reader:
+            batches.append(batch)
+            total += batch.num_rows
+            if total >= n:
+                break
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+    except pa.ArrowInvalid:
+        # a later block contradicts the types inferred from the first one
+        table = pv.read_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+    return table.slice(0, n)
+
+
+def load_raw_head(file_name: str, n: int = 5) -> pd.DataFrame:
+    """Load the first `n` rows of a raw CSV with pyarrow-backed dtypes, parsing only the leading 64 KiB blocks needed."""
+    if n < 0:
+        raise ValueError(f"n must be >= 0, got {n}")
+    file_path = DataDirs.RAW() / file_name
+    if not _PYARROW_AVAILABLE:
+        return pd.read_csv(file_path, nrows=n)
+
+    table = _read_first_rows(
+        file_path,
+        n,
+        read_options=pv.ReadOptions(use_threads=False, block_size=64 * 1024),
+        parse_options=pv.ParseOptions(delimiter=","),
+        convert_options=pv.ConvertOptions(),
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def load_raw_data_batches(
+    file_name: str,
+    batch_size: int = 65536,
+    columns: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+) -> Iterator["pa.RecordBatch"]:
+    """Stream a raw CSV as Arrow record batches of `batch_size` rows (the last may be shorter), one at a time."""
+    if not _PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required to stream CSV files in batches")
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be > 0, got {batch_size}")
+
+    # types are inferred from the first block only; a later block that widens a column (e.g. 1.5 after ints)
+    # raises ArrowInvalid mid-iteration unless its type is pinned through `dtype`
+    reader = pv.open_csv(
+        DataDirs.RAW() / file_name,
+        # block_size is in bytes; assume ~256 bytes per row
+        read_options=pv.ReadOptions(use_threads=True, block_size=batch_size * 256),
+        convert_options=pv.ConvertOptions(include_columns=columns, column_types=dtype),
+    )
+
+    # parsed blocks don't line up with batch_size, so re-cut them (slices are zero-copy)
+    pending: List["pa.RecordBatch"] = []
+    pending_rows = 0
+    for block in reader:
+        offset = 0
+        while offset < block.num_rows:
+            take = min(batch_size - pending_rows, block.num_rows - offset)
+            pending.append(block.slice(offset, take))
+            pending_rows += take
+            offset += take
+            if pending_rows == batch_size:
+                yield pending[0] if len(pending) == 1 else pa.concat_batches(pending)
+                pending, pending_rows = [], 0
+    if pending:
+        yield pending[0] if len(pending) == 1 else pa.concat_batches(pending)
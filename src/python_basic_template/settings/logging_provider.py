@@ -1,11 +1,15 @@
 from __future__ import annotations
+import atexit
+import functools
 import os
+import queue
+import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import logging
 import logging.config
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 try:
@@ -15,6 +19,9 @@ except Exception:
     _RICH_AVAILABLE = False
 
 
+VERBOSE_FORMAT = "%(asctime)s %(logging_channel)s | %(levelname)s: %(name)s:%(lineno)d: %(message)s"
+
+
 
 class LoggingChannelFilter(logging.Filter):
 
@@ -23,14 +30,24 @@ class LoggingChannelFilter(logging.Filter):
         self.project_name = project_name
         self.channel_mapping = channel_mapping or {}
 
-    def _alias_for(self, logger_name: str) -> str:
+        # one alternation, longest prefix first, matching a whole dotted segment
+        items = sorted(self.channel_mapping.items(), key=lambda kv: -len(kv[0]))
+        self._alias_by_prefix = dict(items)
+        self._pattern = (
+            re.compile("(" + "|".join(re.escape(lname) for lname, _ in items) + r")(?:\.|\Z)")
+            if items else None
+        )
+        # logger names are few and repeat on every record
+        self._alias_for = functools.lru_cache(maxsize=1024)(self._resolve_alias)
+
+    def _resolve_alias(self, logger_name: str) -> str:
         if not logger_name or logger_name == "root":
             return self.project_name
 
-        if self.channel_mapping:
-            for lname, alias in sorted(self.channel_mapping.items(), key=lambda kv: len(kv[0]), reverse=True):
-                if logger_name == lname or logger_name.startswith(lname + "."):
-                    return alias
+        if self._pattern is not None:
+            m = self._pattern.match(logger_name)
+            if m:
+                return self._alias_by_prefix[m.group(1)]
 
         pn = self.project_name
         if logger_name == pn:
@@ -42,17 +59,32 @@ class LoggingChannelFilter(logging.Filter):
         return logger_name.split(".", 1)[0]
 
     def filter(self, record: logging.LogRecord) -> bool:
-        record.logging_channel = self._alias_for(record.name)
+        # handler level is checked before handler filters, so this only runs for enabled records;
+        # the channel is set once even when several handlers share the filter
+        if "logging_channel" not in record.__dict__:
+            record.logging_channel = self._alias_for(record.name)
         return True
 
 
 class CallableHandler(logging.Handler):
 
+    # resolved once per process and shared by every handler instance
+    _cached_callback = None
+    _callback_resolved = False
+
     def __init__(self) -> None:
         super().__init__()
         self._callback = self._resolve_callback()
 
-    def _resolve_callback(self):
+    @classmethod
+    def _resolve_callback(cls):
+        if not cls._callback_resolved:
+            cls._cached_callback = cls._import_callback()
+            cls._callback_resolved = True
+        return cls._cached_callback
+
+    @staticmethod
+    def _import_callback():
         import importlib
         path = os.getenv("LOGGING_CUSTOM_CALLBACK", "").strip()
         if not path or "." not in path:
@@ -72,14 +104,58 @@ class CallableHandler(logging.Handler):
                 pass
 
 
-class LoggingConfigProvider:
+class QueueTargetHandler(QueueHandler):
+    """Enqueue records tagged with the log file the listener should write them to."""
+
+    def __init__(self, log_queue: queue.SimpleQueue, target: str) -> None:
+        super().__init__(log_queue)
+        self.target = target
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.log_target = self.target
+        return record
+
+
+class FileQueueListener(QueueListener):
+    """Background listener that routes queued records to rotating file handlers keyed by path, opened on first use."""
+
+    def __init__(self, log_queue: queue.SimpleQueue, formatter: logging.Formatter) -> None:
+        # handle() does its own routing; levels are already applied by the QueueTargetHandlers
+        super().__init__(log_queue)
+        self.formatter = formatter
+        self.targets: Dict[str, dict] = {}
+        self._opened: Dict[str, logging.Handler] = {}
 
-    _instance: Optional["LoggingConfigProvider"] = None
+    def handle(self, record: logging.LogRecord) -> None:
+        record = self.prepare(record)
+        target = getattr(record, "log_target", None)
+        handler = self._opened.get(target)
+        if handler is None:
+            spec = self.targets.get(target)
+            if spec is None:
+                return
+            handler = RotatingFileHandler(**spec, encoding="utf-8", delay=True)
+            handler.setFormatter(self.formatter)
+            self._opened[target] = handler
+        handler.handle(record)
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    def stop(self) -> None:
+        # QueueListener.stop() fails on a second call before 3.12; the atexit hook may be that second call
+        if self._thread is not None:
+            super().stop()
+
+
+@functools.cache
+def _file_listener() -> FileQueueListener:
+    """The process-wide listener, so providers sharing a log file share one RotatingFileHandler for it."""
+    listener = FileQueueListener(queue.SimpleQueue(), formatter=logging.Formatter(VERBOSE_FORMAT))
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+class LoggingConfigProvider:
 
     def __init__(
         self,
@@ -102,6 +178,11 @@ class LoggingConfigProvider:
         self.__handlers: Dict[str, dict] = {}
         self.__loggers: Dict[str, dict] = {}
         self.__channel_mapping: Dict[str, str] = {}
+        self._config: Optional[Dict[str, dict]] = None
+
+        # files are written by the shared listener, not by dictConfig handlers, so they always use
+        # VERBOSE_FORMAT; editing the config's "formatters" does not change file output
+        self._listener = _file_listener()
 
         self._configure_root()
 
@@ -113,17 +194,27 @@ class LoggingConfigProvider:
         handlers: Optional[List[str]] = None,
     ) -> "LoggingConfigProvider":
 
-        for lname in logger_names:
-            alias = self._alias_for(lname)
+        self._config = None
+        aliases = {lname: self._alias_for(lname) for lname in logger_names}
+        handlers = handlers or []
 
+        # build handlers once per alias, not once per logger
+        file_handlers: Dict[str, str] = {}
+        custom_handlers: Dict[str, str] = {}
+        for alias in dict.fromkeys(aliases.values()):
+            if "file" in handlers:
+                file_handlers[alias] = self._ensure_file_handler(alias, level)
+            if "custom" in handlers:
+                custom_handlers[alias] = self._ensure_custom_handler(alias, level)
+
+        for lname, alias in aliases.items():
             handler_names: List[str] = []
-            if handlers:
-                if "console" in handlers:
-                    handler_names.append("console")
-                if "file" in handlers:
-                    handler_names.append(self._ensure_file_handler(alias, level))
-                if "custom" in handlers:
-                    handler_names.append(self._ensure_custom_handler(alias, level))
+            if "console" in handlers:
+                handler_names.append("console")
+            if alias in file_handlers:
+                handler_names.append(file_handlers[alias])
+            if alias in custom_handlers:
+                handler_names.append(custom_handlers[alias])
 
             propagate = not bool(handler_names)  # only propagate if no handlers attached
 
@@ -137,11 +228,15 @@ class LoggingConfigProvider:
         return self
 
     def get_logging_config(self) -> Dict[str, dict]:
+        # dictConfig works on converted copies, so the internal maps can be handed over as-is
+        if self._config is not None:
+            return self._config
+
         filters = dict(
             logging_channel=dict(
                 **{"()": f"{__name__}.LoggingChannelFilter"},
                 project_name=self.project_name,
-                channel_mapping=self.__channel_mapping.copy(),
+                channel_mapping=self.__channel_mapping,
             )
         )
 
@@ -150,10 +245,11 @@ class LoggingConfigProvider:
             disable_existing_loggers=False,
             filters=filters,
             formatters=self._build_formatters(),
-            handlers=self.__handlers.copy(),
-            loggers=self.__loggers.copy(),
+            handlers=self.__handlers,
+            loggers=self.__loggers,
             root=dict(level=self._root_level(), handlers=self._root_handlers()),
         )
+        self._config = config
         return config
 
 
@@ -195,7 +291,7 @@ class LoggingConfigProvider:
     def _build_formatters(self) -> Dict[str, dict]:
 
         simple = dict(format="%(logging_channel)s | %(levelname)s: %(message)s")
-        verbose = dict(format="%(asctime)s %(logging_channel)s | %(levelname)s: %(name)s:%(lineno)d: %(message)s")
+        verbose = dict(format=VERBOSE_FORMAT)
         detailed = dict(format="%(asctime)s %(logging_channel)s | %(levelname)s: pid=%(process)d tid=%(thread)d %(name)s:%(lineno)d: %(message)s")
 
         rich_fmt = dict(format="%(logging_channel)s | %(message)s")
@@ -203,14 +299,19 @@ class LoggingConfigProvider:
         return dict(simple=simple, verbose=verbose, detailed=detailed, rich=rich_fmt)
 
     def _build_file_handler(self, filename: Path, level: str) -> dict:
-        return dict(
-            **{"class": "logging.handlers.RotatingFileHandler"},
-            level=level,
-            filename=str(filename),
+        # the rotating file is written by the listener thread; loggers only enqueue.
+        # the first provider to register a path decides its rotation settings
+        target = os.path.abspath(filename)
+        self._listener.targets.setdefault(target, dict(
+            filename=target,
             maxBytes=self.max_bytes,
             backupCount=self.backups,
-            encoding="utf-8",
-            formatter="verbose",
+        ))
+        return dict(
+            **{"()": f"{__name__}.QueueTargetHandler"},
+            log_queue=self._listener.queue,
+            target=target,
+            level=level,
             filters=["logging_channel"],
         )
 
@@ -1,3 +1,4 @@
+import functools
 import logging.config
 from pathlib import Path
 from python_basic_template.utils.file_utils import ensure_dir
@@ -6,17 +7,32 @@ from python_basic_template.settings.logging_provider import LoggingConfigProvide
 
 PROJECT_NAME = 'python_basic_template'
 DEBUG = True
-BASE_DATA_DIR = Path(__file__).parent.parent.parent.parent / 'data'
+BASE_DATA_DIR = Path(__file__).resolve().parents[3] / 'data'
 
 
 class DataDirs:
-    BASE = ensure_dir(BASE_DATA_DIR)
-    RAW = ensure_dir(BASE_DATA_DIR / 'raw')
-    INTERIM = ensure_dir(BASE_DATA_DIR / 'interim')
+    """Data directories, created on first access rather than at import."""
+
+    @staticmethod
+    @functools.cache
+    def _ensured(path: Path) -> Path:
+        return ensure_dir(path)
+
+    @classmethod
+    def BASE(cls) -> Path:
+        return cls._ensured(BASE_DATA_DIR)
+
+    @classmethod
+    def RAW(cls) -> Path:
+        return cls._ensured(BASE_DATA_DIR / 'raw')
+
+    @classmethod
+    def INTERIM(cls) -> Path:
+        return cls._ensured(BASE_DATA_DIR / 'interim')
 
 
 logging_provider = LoggingConfigProvider(
-    log_dir=DataDirs.BASE / 'logs',
+    log_dir=BASE_DATA_DIR / 'logs',
     debug=DEBUG,
     project_name=PROJECT_NAME,
     use_rich=True,
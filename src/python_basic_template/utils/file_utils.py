@@ -1,6 +1,37 @@
-import os, json
+import os, json, stat, uuid
 from pathlib import Path
-from typing import Union, Any, List
+from typing import Union, Any, Iterator, List, Tuple
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except Exception:
+    _ORJSON_AVAILABLE = False
+
+
+def _orjson_default(obj: Any) -> Any:
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any, indent: int, ensure_ascii: bool) -> bytes:
+    # orjson only indents by 2 and always emits UTF-8, so other calls (including the default indent=4) use json.
+    # Datetimes, dataclasses, subclasses of builtins and non-str keys are passed back to json, so orjson never
+    # accepts more than json does; anything it rejects is retried with json for the exact same result.
+    # Still different from json: compact output has no spaces, floats are formatted as 1e16 rather than 1e+16,
+    # NaN/Infinity become null, and UUIDs and Enum members are encoded rather than rejected
+    if _ORJSON_AVAILABLE and not ensure_ascii and indent in (None, 0, 2):
+        option = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+            | (orjson.OPT_INDENT_2 if indent else 0)
+        )
+        try:
+            return orjson.dumps(data, default=_orjson_default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii).encode('utf-8')
+
 
 def ensure_dir(path: Union[str, Path]) -> Path:
     """Ensure the directory exists (create parents as needed) and return the Path."""
@@ -9,37 +40,72 @@ def ensure_dir(path: Union[str, Path]) -> Path:
     return p
 
 
+def _open_temp_file(file_dir: str) -> Tuple[int, str]:
+    """Create a unique temp file in file_dir with mode 0o666 less the umask, like a plain open() would."""
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+    while True:
+        tmp_path = os.path.join(file_dir, f'.json_{uuid.uuid4().hex}')
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
 def save_as_json(data: Any, file_path: str, indent: int = 4, ensure_ascii: bool = False) -> None:
-    """Write JSON-serializable data to file_path, creating parent dirs as needed, with errors clarified."""
+    """Atomically write JSON-serializable data to file_path, creating parent dirs as needed, with errors clarified.
+
+    A symlinked target is replaced rather than written through and the owner is not kept; orjson only speeds up indent None/0/2, never the default indent=4.
+    """
     try:
-        file_dir = os.path.dirname(file_path)
-        ensure_dir(file_dir)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
-    
+        payload = _dumps(data, indent, ensure_ascii)
     except TypeError as e:
-        raise TypeError(f"Data is not JSON serializable: {e}")
+        raise TypeError(f"Data is not JSON serializable: {e}") from e
+
+    file_dir = os.path.dirname(file_path) or '.'
+    try:
+        ensure_dir(file_dir)
+        # write next to the target and swap it in, so readers never see a partial file
+        fd, tmp_path = _open_temp_file(file_dir)
+        try:
+            with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+                f.write(payload)
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
     except PermissionError as e:
-        raise PermissionError(f"Permission denied when writing to {file_path}: {e}")
-    except Exception as e:
-        raise Exception(f"Failed to save JSON file: {e}")
+        raise PermissionError(f"Permission denied when writing to {file_path}: {e}") from e
 
 
 def open_json(file_path: str) -> Any:
     """Read JSON from file_path and return parsed data, with clear errors."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+    except PermissionError as e:
+        raise PermissionError(f"Permission denied when reading {file_path}: {e}") from e
 
+    try:
+        return json.loads(raw)
     except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(f"Invalid JSON in file {file_path}: {e}", e.doc, e.pos)
-    except PermissionError as e:
-        raise PermissionError(f"Permission denied when reading {file_path}: {e}")
-    except Exception as e:
-        raise Exception(f"Failed to read JSON file: {e}")
+        raise json.JSONDecodeError(f"Invalid JSON in file {file_path}: {e}", e.doc, e.pos) from e
+
+
+def stream_json(file_path: str, item_path: str = 'item') -> Iterator[Any]:
+    """Yield the items under item_path (top-level array elements by default) without loading the whole file; needs ijson."""
+    try:
+        import ijson
+    except ImportError as e:
+        raise ImportError("ijson is required to stream JSON files; install the 'json' extra") from e
+    with open(file_path, 'rb') as f:
+        yield from ijson.items(f, item_path, use_float=True)
 
 
-def get_directory_files_list(directory: Path) -> List[Path]:
-    """Get a list of files in a directory."""
-    return [f.name for f in directory.iterdir() if f.is_file()]
\ No newline at end of file
+def get_directory_files_list(directory: Union[str, Path]) -> List[str]:
+    """Get the names of the files in a directory."""
+    with os.scandir(directory) as it:
+        return [e.name for e in it if e.is_file()]
\ No newline at end of file